@@ -18,8 +18,6 @@
 # documentation root, use os.path.abspath to make it absolute, like shown here.
 #
 import os
-import sys
-from unittest.mock import MagicMock
 
 ON_RTD = os.environ.get('READTHEDOCS', None) == 'True'
 
@@ -34,8 +32,6 @@ ON_RTD = os.environ.get('READTHEDOCS', None) == 'True'
 # ones.
 extensions = [
     'sphinx.ext.autodoc',
-    'sphinx.ext.doctest',
-    'sphinx.ext.coverage',
     'sphinx.ext.mathjax',
     'sphinx.ext.napoleon',
     'sphinx.ext.intersphinx',
@@ -180,9 +176,11 @@ texinfo_documents = [
 autodoc_default_flags = ['members', 'show-inheritance']
 
 # -- Links to external documentation
+# Only projects referenced in the documentation. Use the canonical
+# locations so fetching each objects.inv does not follow redirects
 intersphinx_mapping = {
-        'python': ('https://docs.python.org/3.5', None),
-        'matplotlib': ('https://matplotlib.org', None),
-        'numpy': ('https://docs.scipy.org/doc/numpy/', None)
+        'python': ('https://docs.python.org/3', None),
+        'matplotlib': ('https://matplotlib.org/stable', None),
+        'numpy': ('https://numpy.org/doc/stable', None)
     }
 
@@ -0,0 +1,26 @@
+"""
+Helpers shared by the scripts that generate documentation files
+"""
+from os.path import exists
+
+
+def writeIfChanged(filePath, content):
+    """
+    Write ``content`` to ``filePath`` only if the contents differ.
+
+    Sphinx rebuilds any page whose file has been modified since the
+    last build, so leaving unchanged files untouched keeps incremental
+    builds from rebuilding these pages every time.
+
+    Returns
+    -------
+    bool
+        True if the file was written
+    """
+    if exists(filePath):
+        with open(filePath) as current:
+            if current.read() == content:
+                return False
+    with open(filePath, 'w') as target:
+        target.write(content)
+    return True
@@ -6,6 +6,8 @@ from os.path import join
 from sys import version_info
 import serpentTools
 
+from docUtils import writeIfChanged
+
 pyVersion = '{}.{}.{}'.format(*version_info[:3])
 
 magicStrings = serpentTools.plot.PLOT_MAGIC_STRINGS
@@ -16,7 +18,7 @@ magicOpts = [
 targetFile = join('develop', 'magicPlotOpts.rst')
 print("Making magic plot conversion options with \n  python: {}"
       "\n  serpentTools: {}".format(pyVersion, serpentTools.__version__))
-with open(targetFile, 'w') as target:
-    target.write('\n'.join(magicOpts))
-
-print('  done')
+if writeIfChanged(targetFile, '\n'.join(magicOpts)):
+    print('  done')
+else:
+    print('  unchanged')
@@ -7,7 +7,8 @@ from serpentTools import __version__ as sssPackVers
 from serpentTools.objects import convertVariableName
 
 import yaml
-from six import iteritems
+
+from docUtils import writeIfChanged
 
 PYTHON_VERSION = '{}.{}.{}'.format(*pyVersInfo[:3])
 VAR_FMTR = "  * ``{original}`` →  ``{converted}``\n"
@@ -50,14 +51,15 @@ if __name__ == '__main__':
     baseDict = variables.pop('base')
     baseGroups = set(baseDict.keys())
     
-    with open(OUT_FILE, 'w') as out:
-        for version, varSet in iteritems(variables):
-            out.write(makeVersionHeading(version))
-            for group in varSet:
-                out.write(makeVarGroupHeading(version, group))
-                out.write(varsToBullets(varSet[group]))
-        out.write(makeVersionHeading('base'))
-        for group in sorted(baseGroups):
-            baseVars = baseDict[group]
-            out.write(makeVarGroupHeading('base', group))
-            out.write(varsToBullets(baseVars))
+    out = []
+    for version, varSet in variables.items():
+        out.append(makeVersionHeading(version))
+        for group in varSet:
+            out.append(makeVarGroupHeading(version, group))
+            out.append(varsToBullets(varSet[group]))
+    out.append(makeVersionHeading('base'))
+    for group in sorted(baseGroups):
+        baseVars = baseDict[group]
+        out.append(makeVarGroupHeading('base', group))
+        out.append(varsToBullets(baseVars))
+    writeIfChanged(OUT_FILE, ''.join(out))
@@ -9,18 +9,16 @@ Called with::
 import re
 import argparse
 
-import six
-
 import serpentTools
 from serpentTools import settings
 
 _VERB_MAP = {'v': {1: 'info', 2: 'debug'},
              'q': {1: 'error', 2: 'critical'}}
 _VERB_MSG = {}
-for key, items in six.iteritems(_VERB_MAP):
+for key, items in _VERB_MAP.items():
     _VERB_MSG[key] = ', '.join(
         ['{}: {}'.format(key * num, value)
-         for num, value in six.iteritems(items)])
+         for num, value in items.items()])
 
 
 def __buildParser():
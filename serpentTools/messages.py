@@ -57,29 +57,35 @@ dictConfig(loggingConfig)
 __logger__ = logging.getLogger('serpentTools')
 
 
-def debug(message):
-    """Log a debug message."""
-    __logger__.debug('%s', message)
+def debug(message, *args):
+    """
+    Log a debug message.
 
+    If given, ``args`` are merged into ``message`` using ``%``
+    formatting only if the message will be logged, e.g.
+    ``debug('Adding %s data to %s', variable, name)``
+    """
+    __logger__.debug(message, *args)
 
-def info(message):
+
+def info(message, *args):
     """Log an info message, e.g. status update."""
-    __logger__.info('%s', message)
+    __logger__.info(message, *args)
 
 
-def warning(message):
+def warning(message, *args):
     """Log a warning that something could go wrong or should be avoided."""
-    __logger__.warning('%s', message)
+    __logger__.warning(message, *args)
 
 
-def error(message):
+def error(message, *args):
     """Log that something caused an exception but was suppressed."""
-    __logger__.error('%s', message)
+    __logger__.error(message, *args)
 
 
-def critical(message):
+def critical(message, *args):
     """Log that something has gone horribly wrong."""
-    __logger__.critical('%s', message, exc_info=True)
+    __logger__.critical(message, *args, exc_info=True)
 
 
 def updateLevel(level):
@@ -11,14 +11,22 @@ class NamedObject(object):
         return '<{} {}>'.format(self.__class__.__name__, self.name)
 
 
+_CONVERTED_NAMES = {}
+"""Previously converted variable names, as the same names repeat often"""
+
+
 def convertVariableName(variable):
     """Convert a SERPENT variable to camelCase"""
+    if variable in _CONVERTED_NAMES:
+        return _CONVERTED_NAMES[variable]
     lowerSplits = [item.lower() for item in variable.split('_')]
     if len(lowerSplits) == 1:
-        return lowerSplits[0]
+        converted = lowerSplits[0]
     else:
-        return lowerSplits[0] + ''.join([item.capitalize()
-                                         for item in lowerSplits[1:]])
+        converted = lowerSplits[0] + ''.join([item.capitalize()
+                                              for item in lowerSplits[1:]])
+    _CONVERTED_NAMES[variable] = converted
+    return converted
 
 
 def splitItems(items):
@@ -1,12 +1,25 @@
 """Classes for storing material data."""
 
+import re
+
 import numpy
-from matplotlib import pyplot
 
 from serpentTools.messages import warning, debug
 from serpentTools.plot import magicPlotDocDecorator
 from serpentTools.objects import NamedObject, convertVariableName
 
+ISOTOPE_BLOCK_SIZE = 8
+"""Default number of isotopic quantities, e.g. ``adens``, to allocate"""
+ISOTOPE_BLOCK_REGEX = re.compile(r'[ \t]*\r?\n')
+"""Matches arrays that begin on a new line and store one row per isotope"""
+
+DIRECT_ATTRS = {
+    'burnup': 'Burnup',
+    'adens': 'Atomic densities',
+    'mdens': 'Mass densities',
+}
+"""Quantities also stored as attributes, e.g. ``material.adens``"""
+
 
 class DepletedMaterialBase(NamedObject):
     PLOT_XLABELS = {'days': "Days", 'burnup': r"Burnup $[MWd/kgU]$"}
@@ -57,9 +70,6 @@ class DepletedMaterialBase(NamedObject):
     def __init__(self, name, metadata):
         NamedObject.__init__(self, name)
         self.data = {}
-        self.__burnup = None
-        self.__mdens = None
-        self.__adens = None
         self.zai = metadata.get('zai', None)
         self.names = metadata.get('names', None)
         self.days = metadata.get('days', None)
@@ -71,35 +81,35 @@ class DepletedMaterialBase(NamedObject):
         return self.data[item]
 
     @property
-    def burnup(self):
-        if 'burnup' not in self.data:
-            raise AttributeError('Burnup for material {} has not been loaded'
-                                 .format(self.name))
-        return self.data['burnup']
+    def names(self):
+        return self.__names
 
-    @property
-    def adens(self):
-        if 'adens' not in self.data:
-            raise AttributeError('Atomic densities for material {} have not '
-                                 'been loaded'.format(self.name))
-        return self.data['adens']
+    @names.setter
+    def names(self, value):
+        self.__names = value
+        self.__nameIndex = None
 
     @property
-    def mdens(self):
-        if 'mdens' not in self.data:
-            raise AttributeError('Mass densities for material {} has not been '
-                                 'loaded'.format(self.name))
-        return self.data['mdens']
-
-    def _getIsoID(self, isotopes):
-        """Return the row indices that correspond to specfic isotopes."""
-        if not isotopes:
-            return numpy.array(list(range(len(self.names))), dtype=int)
-        isoList = [isotopes] if isinstance(isotopes, (str, int)) else isotopes
-        rowIDs = numpy.empty_like(isoList, dtype=int)
-        for indx, isotope in enumerate(isoList):
-            rowIDs[indx] = self.names.index(isotope)
-        return rowIDs
+    def _nameIndex(self):
+        """Dictionary mapping isotope names to their rows in the data."""
+        if self.__nameIndex is None:
+            self.__nameIndex = {name: indx for indx, name
+                                in enumerate(self.__names)}
+        return self.__nameIndex
+
+    def __getattr__(self, name):
+        # only reached if normal attribute lookup fails
+        if name in DIRECT_ATTRS:
+            raise AttributeError('{} for material {} not loaded'
+                                 .format(DIRECT_ATTRS[name], self.name))
+        raise AttributeError("'{}' object has no attribute '{}'"
+                             .format(self.__class__.__name__, name))
+
+    def _setData(self, name, value):
+        """Store data, and as an attribute if in ``DIRECT_ATTRS``."""
+        self.data[name] = value
+        if name in DIRECT_ATTRS:
+            setattr(self, name, value)
 
     def getValues(self, xUnits, yUnits, timePoints=None, names=None):
         """
@@ -133,7 +143,8 @@ class DepletedMaterialBase(NamedObject):
             If the names of the isotopes have not been obtained and specific
             isotopes have been requested
         KeyError
-            If at least one of the days requested is not present
+            If at least one of the days or isotopes requested is not
+            present
         """
         if names and self.names is None:
             raise AttributeError(
@@ -145,39 +156,58 @@ class DepletedMaterialBase(NamedObject):
 
     @staticmethod
     def _slice(data, rows, cols):
-        if data.shape[0] == 1 or len(data.shape) == 1 or rows is None:
-            yVals = data[cols]
-            return yVals
-        return data[:, cols][rows]
-
-    def _checkTimePoints(self, actual, requested):
-        """Return a list of all requested points in time not stored."""
-        badPoints = [str(time) for time in requested if time not in actual]
-        if any(badPoints):
+        if rows is None or data.ndim == 1:
+            return data[cols]
+        return data[numpy.ix_(rows, cols)]
+
+    def _checkTimePoints(self, requested, found):
+        """Raise an error if any requested points in time are not stored."""
+        if not found.all():
+            badPoints = [str(time) for time in requested[~found]]
             raise KeyError(
                 'The following times were not present for material {}'
                 '\n{}'.format(self.name, ', '.join(badPoints)))
 
     def _getColIndices(self, xUnits, timePoints):
-        """Return row and column indices corresponding to isotopes and times"""
+        """
+        Return the column indices corresponding to specific times.
+
+        Indices are returned in the order the points are stored. If
+        the x values are strictly increasing, e.g. ``days``, the points
+        are located with a binary search. Otherwise, e.g. ``burnup``
+        during decay steps, every stored point that was requested is
+        selected.
+        """
         allX = self.days if xUnits == 'days' else self.data[xUnits]
         if timePoints is None:
-            return numpy.arange(len(allX), dtype=int)
-        self._checkTimePoints(allX, timePoints)
-        colIndices = [indx for indx, xx in enumerate(allX) if xx in timePoints]
-        return colIndices
+            return numpy.arange(len(allX), dtype=numpy.intp)
+        allX = numpy.asarray(allX)
+        # match the precision of float data, e.g. float32, without
+        # truncating requested points to match integer data
+        requested = numpy.asarray(
+            timePoints, dtype=allX.dtype if allX.dtype.kind == 'f' else float)
+        if allX.size and (allX[1:] > allX[:-1]).all():
+            colIndices = numpy.searchsorted(allX, requested)
+            found = allX[numpy.minimum(colIndices, len(allX) - 1)] == requested
+            self._checkTimePoints(requested, found)
+            return numpy.unique(colIndices)
+        stored = set(allX.tolist())
+        self._checkTimePoints(requested, numpy.array(
+            [point in stored for point in requested.tolist()], dtype=bool))
+        requested = set(requested.tolist())
+        return numpy.array([indx for indx, xx in enumerate(allX.tolist())
+                            if xx in requested], dtype=numpy.intp)
 
     def _getRowIndices(self, isotopes):
         """
         Return the indices in ``names`` that correspond to specific isotopes.
         """
         if not isotopes:
-            return numpy.arange(len(self.names), dtype=int)
+            return numpy.arange(len(self.names), dtype=numpy.intp)
         isoList = [isotopes] if isinstance(isotopes, (str, int)) else isotopes
-        rowIDs = numpy.empty_like(isoList, dtype=int)
-        for indx, isotope in enumerate(isoList):
-            rowIDs[indx] = self.names.index(isotope)
-        return rowIDs
+        nameIndex = self._nameIndex
+        return numpy.fromiter((nameIndex[iso] for iso in isoList),
+                              dtype=numpy.intp, count=len(isoList))
 
     def _formatLabel(self, labelFmt, names):
         if isinstance(names, str):
@@ -193,14 +223,32 @@ class DepletedMaterialBase(NamedObject):
         else:
             zaiLookup = self.zai
         names = names or self.names
+        nameIndex = self._nameIndex
         for name in names:
             labels.append(fmtr.format(mat=self.name, iso=name,
-                          zai=zaiLookup[self.names.index(name)]))
+                          zai=zaiLookup[nameIndex[name]]))
 
         return labels
 
 class DepletedMaterial(DepletedMaterialBase):
-    __doc__ = DepletedMaterialBase.__doc__
+    docParams = DepletedMaterialBase.docParams + """
+    dtype: str or :py:class:`numpy.dtype`
+        Floating point type used to store all data, controlled by the
+        ``depletion.dtype`` setting when reading files
+    blockSize: int
+        Number of isotopic quantities, e.g. ``adens``, to allocate
+        space for. More space is added if needed, and unused space is
+        removed with :py:meth:`trimBlock`"""
+    __doc__ = DepletedMaterialBase.__doc__.replace(
+        DepletedMaterialBase.docParams, docParams)
+
+    def __init__(self, name, metadata, dtype='float64',
+                 blockSize=ISOTOPE_BLOCK_SIZE):
+        DepletedMaterialBase.__init__(self, name, metadata)
+        self.dtype = numpy.dtype(dtype)
+        self._blockSize = blockSize
+        self._block = None
+        self._varIdx = {}
 
     def addData(self, variable, rawData):
         """
@@ -210,19 +258,77 @@ class DepletedMaterial(DepletedMaterialBase):
         ----------
         variable: str
             Name of the variable directly from ``SERPENT``
-        rawData: list
-            List of strings corresponding to the raw data from the file
+        rawData: str or list
+            Raw data from the file. A list of strings, or a string
+            that begins with a new line, is stored with one row per line
         """
         newName = convertVariableName(variable)
-        debug('Adding {} data to {}'.format(newName, self.name))
+        debug('Adding %s data to %s', newName, self.name)
         if isinstance(rawData, str):
-            scratch = [float(item) for item in rawData.split()]
-        else:
-            scratch = []
-            for line in rawData:
-                if line:
-                    scratch.append([float(item) for item in line.split()])
-        self.data[newName] = numpy.array(scratch)
+            if not ISOTOPE_BLOCK_REGEX.match(rawData):
+                self._setData(newName, numpy.array(rawData.split(),
+                                                   dtype=self.dtype))
+                return
+            rawData = rawData.splitlines()
+        rows = [line.split() for line in rawData if line.strip()]
+        if not rows:
+            self._setData(newName, numpy.array([], dtype=self.dtype))
+            return
+        numCols = len(rows[0])
+        if any(len(row) != numCols for row in rows):
+            raise ValueError(
+                'Rows of {} for material {} do not have the same number of '
+                'values'.format(variable, self.name))
+        self._addToBlock(newName, numpy.array(rows, dtype=self.dtype))
+
+    def _addToBlock(self, name, values):
+        """
+        Store isotopic data as a view into one contiguous array.
+
+        All quantities with shape ``(isotopes, times)`` are stored in
+        ``self._block``, with ``self._varIdx`` mapping the name of the
+        variable to the first index. The block grows if more
+        quantities are added than initially allocated.
+        """
+        if self._block is None:
+            self._block = numpy.empty((self._blockSize, ) + values.shape,
+                                      dtype=self.dtype)
+        elif values.shape != self._block.shape[1:]:
+            self._setData(name, values)
+            return
+        indx = self._varIdx.get(name)
+        if indx is None:
+            indx = len(self._varIdx)
+            if indx == self._block.shape[0]:
+                self._growBlock()
+            self._varIdx[name] = indx
+        self._block[indx] = values
+        self._setData(name, self._block[indx])
+
+    def _growBlock(self):
+        """Double the size of the block and point data to the new block."""
+        numVars = self._block.shape[0]
+        block = numpy.empty((max(2 * numVars, 1), ) + self._block.shape[1:],
+                            dtype=self.dtype)
+        block[:numVars] = self._block
+        self._setBlock(block)
+
+    def _setBlock(self, block):
+        """Replace the block and point data to the new block."""
+        self._block = block
+        for name, indx in self._varIdx.items():
+            self._setData(name, block[indx])
+
+    def trimBlock(self):
+        """
+        Release space allocated for isotopic quantities that were not added.
+
+        Called by the
+        :py:class:`~serpentTools.parsers.depletion.DepletionReader`
+        after reading, so each material only holds the data it stores.
+        """
+        if self._block is not None and len(self._varIdx) < len(self._block):
+            self._setBlock(self._block[:len(self._varIdx)].copy())
     
     @magicPlotDocDecorator
     def plot(self, xUnits, yUnits, timePoints=None, names=None, ax=None,
@@ -282,10 +388,13 @@ class DepletedMaterial(DepletedMaterialBase):
         xVals = timePoints if timePoints is not None else (
             self.days if xUnits == 'days' else self.burnup)
         yVals = self.getValues(xUnits, yUnits, xVals, names)
-        ax = ax or pyplot.axes()
+        if ax is None:
+            from matplotlib import pyplot
+            ax = pyplot.axes()
         labels = self._formatLabel(labelFmt, names)
-        for row in range(yVals.shape[0]):
-            ax.plot(xVals, yVals[row], label=labels[row], **kwargs)
+        lines = ax.plot(xVals, yVals.T, **kwargs)
+        for line, label in zip(lines, labels):
+            line.set_label(label)
 
         # format the plot
         if legend:
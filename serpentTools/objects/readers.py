@@ -15,12 +15,7 @@ class BaseReader:
     def __init__(self, filePath, readerSettingsLevel):
         self.filePath = filePath
         self.metadata = {}
-        if isinstance(readerSettingsLevel, str):
-            self.settings = rc.getReaderSettings(readerSettingsLevel)
-        else:
-            self.settings = {}
-            for level in readerSettingsLevel:
-                self.settings.update(rc.getReaderSettings(level))
+        self.settings = rc.getReaderSettings(readerSettingsLevel)
 
     def __str__(self):
         return '<{} reading {}>'.format(self.__class__.__name__, self.filePath)
@@ -4,8 +4,6 @@ Package dedicated for reading ``SERPENT`` output files
 from os import path
 import re
 
-import six
-
 from numpy import zeros, empty, empty_like, array, longfloat
 
 try:
@@ -70,7 +68,7 @@ def inferReader(filePath):
     SerpentToolsException
         If a reader cannot be inferred
     """
-    for reg, reader in six.iteritems(REGEXES):
+    for reg, reader in REGEXES.items():
         match = re.match(reg, filePath)
         if match and match.group() == filePath:
             debug('Inferred reader for {}: {}'
@@ -211,7 +209,7 @@ def depmtx(fileP):
                                                  nDensRegex)
         debug('Found {} isotopes for file {}'.format(numIso, fileP))
         n0 = empty((numIso, 1), dtype=longfloat)
-        for indx, v in six.iteritems(n0Storage):
+        for indx, v in n0Storage.items():
             n0[indx] = v
 
         zai = []
@@ -3,16 +3,21 @@ import re
 
 from numpy import array
 from matplotlib import pyplot
-from six import iteritems
 
 from serpentTools.plot import magicPlotDocDecorator
-from serpentTools.engines import KeywordParser
 from serpentTools.objects.readers import MaterialReader
-from serpentTools.objects.materials import DepletedMaterial
+from serpentTools.objects.materials import (DepletedMaterial,
+                                            ISOTOPE_BLOCK_SIZE)
 
 from serpentTools.messages import (warning, info, debug, error,
                                    SerpentToolsException)
 
+DEP_BLOCK_REGEX = re.compile(r'^(\w+)\s*=\s*\[(.*?)\];',
+                             re.MULTILINE | re.DOTALL)
+"""Captures the name and contents of each array, e.g. ``ZAI = [...];``"""
+COMMENT_REGEX = re.compile(r'%.*')
+"""Matches trailing comments, e.g. isotope names after each row"""
+
 
 class DepPlotMixin(object):
 
@@ -146,75 +151,67 @@ class DepletionReader(DepPlotMixin, MaterialReader):
 
     def _read(self):
         """Read through the depletion file and store requested data."""
-        keys = ['MAT', 'TOT'] if self.settings['processTotal'] else ['MAT']
-        keys.extend(self.settings['metadataKeys'])
-        separators = ['\n', '];', '\r\n']
-        with KeywordParser(self.filePath, keys, separators) as parser:
-            for chunk in parser.yieldChunks():
-                if 'MAT' in chunk[0]:
-                    self._addMaterial(chunk)
-                elif 'TOT' in chunk[0]:
-                    self._addTotal(chunk)
-                else:
-                    self._addMetadata(chunk)
+        processTotal = self.settings['processTotal']
+        metadataKeys = set(self.settings['metadataKeys'])
+        with open(self.filePath) as fObj:
+            contents = fObj.read()
+        for match in DEP_BLOCK_REGEX.finditer(contents):
+            variable, block = match.groups()
+            if variable.startswith('MAT_'):
+                self._addMaterial(variable, block)
+            elif variable.startswith('TOT_'):
+                if processTotal:
+                    self._addTotal(variable, block)
+            elif variable in metadataKeys:
+                self._addMetadata(variable, block)
+        for material in self.materials.values():
+            material.trimBlock()
         if 'days' in self.metadata:
             for mKey in self.materials:
                 self.materials[mKey].days = self.metadata['days']
 
-    def _addMetadata(self, chunk):
+    def _addMetadata(self, variable, block):
         options = {'ZAI': 'zai', 'NAMES': 'names', 'DAYS': 'days',
                    'BU': 'burnup'}
-        for varName, metadataKey in options.items():
-            if varName in chunk[0]:
-                if varName in ['ZAI', 'NAMES']:
-                    values = [line.strip() for line in chunk[1:]]
-                    if varName == 'NAMES':
-                        values = [item.split()[0][1:] for item in values]
-                else:
-                    line = self._cleanSingleLine(chunk)
-                    values = array([float(item)
-                                   for item in line.split()])
-                self.metadata[metadataKey] = values
-                return
-
-    @staticmethod
-    def _cleanSingleLine(chunk):
-        return chunk[0][chunk[0].index('[') + 1:chunk[0].index(']')]
-
-    def _addMaterial(self, chunk):
-        """Add data from a MAT chunk."""
-        name, variable = self._getGroupsFromChunk(self._matchMatNVar, chunk)
+        if variable not in options:
+            return
+        if variable == 'ZAI':
+            values = block.split()
+        elif variable == 'NAMES':
+            values = [line.split()[0][1:] for line in block.splitlines()
+                      if line.strip()]
+        else:
+            values = array(block.split(), dtype=float)
+        self.metadata[options[variable]] = values
+
+    def _addMaterial(self, variable, block):
+        """Add data from a MAT block."""
+        name, variable = self._getGroupsFromName(self._matchMatNVar, variable)
         if any([re.match(pat, name) for pat in self._matPatterns]):
-            self._processChunk(chunk, name, variable)
+            self._processBlock(block, name, variable)
 
-    def _addTotal(self, chunk):
-        """Add data from a TOT chunk"""
-        variable = self._getGroupsFromChunk(self._matchTotNVar, chunk)[0]
-        self._processChunk(chunk, 'total', variable)
+    def _addTotal(self, variable, block):
+        """Add data from a TOT block"""
+        variable = self._getGroupsFromName(self._matchTotNVar, variable)[0]
+        self._processBlock(block, 'total', variable)
 
-    def _getGroupsFromChunk(self, regex, chunk):
-        match = re.match(regex, chunk[0])
+    def _getGroupsFromName(self, regex, variable):
+        match = re.match(regex, variable)
         if match:
             return match.groups()
-        raise Exception('{} not determine match from the following chunk:\n'
-                        '{}'.format(self, ''.join(chunk)))
+        raise Exception('{} not determine match from the following '
+                        'variable: {}'.format(self, variable))
 
-    def _processChunk(self, chunk, name, variable):
+    def _processBlock(self, block, name, variable):
         if (self.settings['materialVariables']
                 and variable not in self.settings['materialVariables']):
             return
         if name not in self.materials:
-            debug('Adding material {}...'.format(name))
-            self.materials[name] = DepletedMaterial(name, self.metadata)
-        if len(chunk) == 1:  # single line values, e.g. volume or burnup
-            cleaned = self._cleanSingleLine(chunk)
-        else:
-            cleaned = []
-            for line in chunk:
-                if '[' in line or ']' in line:
-                    continue
-                cleaned.append(line[:line.index('%')])
-        self.materials[name].addData(variable, cleaned)
+            debug('Adding material %s...', name)
+            self.materials[name] = DepletedMaterial(
+                name, self.metadata, self.settings['dtype'],
+                len(self.settings['materialVariables']) or ISOTOPE_BLOCK_SIZE)
+        self.materials[name].addData(variable, COMMENT_REGEX.sub('', block))
 
     def _precheck(self):
         """do a quick scan to ensure this looks like a material file."""
@@ -233,7 +230,7 @@ class DepletionReader(DepPlotMixin, MaterialReader):
             error("No materials obtained from {}".format(self.filePath))
             return
 
-        for mKey, mat in iteritems(self.materials):
+        for mKey, mat in self.materials.items():
             assert isinstance(mat, DepletedMaterial), (
                 'Unexpected key {}: {} in materials dictionary'.format(
                     mKey, type(mat))
@@ -1,6 +1,5 @@
 """Parser responsible for reading the ``*det<n>.m`` files"""
 
-from six import iteritems
 from numpy import asfortranarray, empty
 
 from serpentTools.engines import KeywordParser
@@ -41,7 +40,7 @@ class DetectorReader(BaseReader):
             self._loadAll = False
 
     def iterDets(self):
-        for name, detector in iteritems(self.detectors):
+        for name, detector in self.detectors.items():
             yield name, detector
 
     def _read(self):
@@ -1,8 +1,6 @@
 """Parser responsible for reading the ``*res.m`` files"""
 import re
 
-import six
-
 from numpy import array, vstack
 
 from serpentTools.settings import rc
@@ -235,7 +233,7 @@ class ResultsReader(XSReader):
             raise KeyError(
                 'Index read is {}, however only integers above zero are allowed'
                     .format(searchValue))
-        for key, dictUniv in six.iteritems(self.universes):
+        for key, dictUniv in self.universes.items():
             if key[0] == univ and key[searchIndex] == searchValue:
                 debug('Found universe that matches with keys {}'
                       .format(key))
@@ -286,7 +284,7 @@ class ResultsReader(XSReader):
                 "{} time-points, and {} overall result points ".format(self.filePath,
                 self._counter['univ'], self._counter['rslt'], self._counter['meta']))
         if not self.resdata and not self.metadata:
-            for keys, dictUniv in six.iteritems(self.universes):
+            for keys, dictUniv in self.universes.items():
                 if not dictUniv.hasData():
                     raise SerpentToolsException("metadata, resdata and universes are all empty "
                                         "from {}".format(self.filePath))
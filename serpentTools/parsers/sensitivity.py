@@ -4,7 +4,6 @@ Class to read Sensitivity file
 from collections import OrderedDict
 from itertools import product
 
-from six import iteritems
 from numpy import transpose, array, hstack
 from matplotlib.pyplot import axes
 
@@ -132,7 +131,7 @@ class SensitivityReader(BaseReader):
         if self.zais:
             old = self.zais
             self.zais = OrderedDict()
-            for key, value in iteritems(old):
+            for key, value in old.items():
                 if key == 'total':
                     self.zais[key] = value
                     continue
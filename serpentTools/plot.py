@@ -2,8 +2,6 @@
 from functools import wraps
 from textwrap import dedent
 
-from six import iteritems
-
 import numpy
 from numpy import meshgrid, where
 from matplotlib import pyplot
@@ -3,8 +3,6 @@ Class responsible for reading multiple depletion files
 and obtaining true uncertainties
 """
 from math import fabs
-from six import iteritems
-from six.moves import range
 from numpy import zeros, zeros_like
 
 from matplotlib import pyplot
@@ -69,7 +67,7 @@ class DepletionSampler(DepPlotMixin, Sampler):
     def _checkMetadata(self):
         misMatch = {}
         for parser in self:
-            for key, value in iteritems(parser.metadata):
+            for key, value in parser.metadata.items():
                 valCheck = (tuple(value) if key in CONSTANT_MDATA
                             else value.size)
                 if key not in misMatch:
@@ -78,7 +76,7 @@ class DepletionSampler(DepPlotMixin, Sampler):
                     misMatch[key][valCheck] = {parser.filePath}
                 else:
                     misMatch[key][valCheck].add(parser.filePath)
-        for mKey, matches in iteritems(misMatch):
+        for mKey, matches in misMatch.items():
             if len(matches) > 1:
                 self._raiseErrorMsgFromDict(matches, 'values',
                                             '{} metadata'.format(mKey))
@@ -88,7 +86,7 @@ class DepletionSampler(DepPlotMixin, Sampler):
             if not self.metadata:
                 self.__allocateMetadata(parser.metadata)
             self._copyMetadata(parser.metadata, N)
-            for matName, material in iteritems(parser.materials):
+            for matName, material in parser.materials.items():
                 if matName in self.materials:
                     sampledMaterial = self.materials[matName]
                 else:
@@ -100,7 +98,7 @@ class DepletionSampler(DepPlotMixin, Sampler):
         self._finalize()
 
     def _finalize(self):
-        for _matName, material in iteritems(self.materials):
+        for _matName, material in self.materials.items():
             material.finalize()
         for key in VARIED_MDATA:
             allData = self.allMdata[key]
@@ -121,12 +119,12 @@ class DepletionSampler(DepPlotMixin, Sampler):
 
     def _free(self):
         self.allMdata = {}
-        for _mName, material in iteritems(self.materials):
+        for _mName, material in self.materials.items():
             material.free()
 
     def iterMaterials(self):
         """Yields material names and objects"""
-        for name, material in iteritems(self.materials):
+        for name, material in self.materials.items():
             yield name, material
 
 
@@ -176,19 +174,19 @@ class SampledDepletedMaterial(SampledContainer, DepletedMaterialBase):
         if container.name != self.name:
             warning("Attempting to store data from material {} onto "
                     "sampled material {}".format(self.name, container.name))
-        for varName, varData in iteritems(container.data):
+        for varName, varData in container.data.items():
             if not self.allData:
                 self.__allocateLike(container)
             self.allData[varName][self._index] = varData
 
     def __allocateLike(self, container):
-        for varName, varData in iteritems(container.data):
+        for varName, varData in container.data.items():
             shape = tuple([self.N] + list(varData.shape))
             self.allData[varName] = zeros(shape)
 
     def _finalize(self):
-        for varName, varData in iteritems(self.allData):
-            self.data[varName] = varData.mean(axis=0)
+        for varName, varData in self.allData.items():
+            self._setData(varName, varData.mean(axis=0))
             self.uncertainties[varName] = varData.std(axis=0)
 
     def free(self):
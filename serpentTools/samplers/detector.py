@@ -1,8 +1,6 @@
 """
 Class to read and process a batch of similar detector files
 """
-from six import iteritems
-from six.moves import range
 
 from numpy import empty, empty_like, square, sqrt, sum, where, arange
 from matplotlib import pyplot
@@ -51,14 +49,14 @@ class DetectorSampler(Sampler):
         for parser in self.parsers:
             if sizes is None:
                 sizes = {det: {} for det in parser.detectors}
-            for detName, det in iteritems(parser.detectors):
+            for detName, det in parser.detectors.items():
                 level = sizes[detName]
                 shape = det.tallies.shape
                 if shape not in level:
                     level[shape] = {parser.filePath}
                 else:
                     level[shape].add(parser.filePath)
-        for detName, misMatches in iteritems(sizes):
+        for detName, misMatches in sizes.items():
             if len(misMatches) > 1:
                 self._raiseErrorMsgFromDict(misMatches, 'shape', 'detector')
 
@@ -78,7 +76,7 @@ class DetectorSampler(Sampler):
             sampledDet.free()
 
     def iterDets(self):
-        for name, detector in iteritems(self.detectors):
+        for name, detector in self.detectors.items():
             yield name, detector
 
 
@@ -7,8 +7,6 @@ from os import path
 from shutil import copy
 import random
 
-from six.moves import range
-
 from serpentTools.messages import error, debug
 
 __all__ = ['seedFiles']
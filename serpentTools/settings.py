@@ -1,8 +1,6 @@
 """Settings to yield control to the user."""
 import os
-import six
 
-from six import iteritems
 import yaml
 
 from serpentTools import ROOT_DIR
@@ -46,6 +44,13 @@ defaultSettings = {
                        'for each branch',
         'type': list
     },
+    'depletion.dtype': {
+        'default': 'float64',
+        'options': ['float64', 'float32'],
+        'description': 'Floating point type used to store material data. '
+                       'float32 halves the memory required for large files',
+        'type': str
+    },
     'depletion.metadataKeys': {
         'default': ['ZAI', 'NAMES', 'DAYS', 'BU'],
         'options': 'default',
@@ -204,7 +209,7 @@ class DefaultSettingsLoader(dict):
     def _load():
         """Load the default setting objects."""
         defaults = {}
-        for name, value in iteritems(defaultSettings):
+        for name, value in defaultSettings.items():
             if 'options' in value:
                 options = (value['default'] if value['options'] == 'default'
                            else value['options'])
@@ -227,7 +232,7 @@ class DefaultSettingsLoader(dict):
 
     def retrieveDefaults(self):
         """Return a dictionary with the default settings."""
-        return {key: setting.default for key, setting in iteritems(self)}
+        return {key: setting.default for key, setting in self.items()}
 
     def validateSetting(self, name, value):
         """Validate the setting.
@@ -258,6 +263,7 @@ class UserSettingsLoader(dict):
         self._defaultLoader = DefaultSettingsLoader()
         self.__inside = False
         self.__originals = {}
+        self.__readerSettings = {}
         dict.__init__(self, self._defaultLoader.retrieveDefaults())
 
     def __enter__(self):
@@ -266,7 +272,7 @@ class UserSettingsLoader(dict):
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.__inside__ = False
-        for key, originalValue in iteritems(self.__originals):
+        for key, originalValue in self.__originals.items():
             self[key] = originalValue
         self.__originals= {}
 
@@ -297,6 +303,7 @@ class UserSettingsLoader(dict):
         if self._defaultLoader[name].updater is not None:
             value = self._defaultLoader[name].updater(value)
         dict.__setitem__(self, name, value)
+        self.__readerSettings = {}
         messages.debug('Updated setting {} to {}'.format(name, value))
 
     __setitem__ = setValue
@@ -314,7 +321,9 @@ class UserSettingsLoader(dict):
         Returns
         -------
         dict
-            Single level dictionary with ``settingName: settingValue`` pairs
+            Single level dictionary with ``settingName: settingValue`` pairs.
+            Results are cached until a setting is changed, and a new
+            dictionary is returned on every call.
 
         Raises
         ------
@@ -322,18 +331,20 @@ class UserSettingsLoader(dict):
             If the reader name is not located in the ``readers`` settings
             dictionary
         """
-        settings = {}
         settingsPreffix = (
-            [settingsPreffix] if isinstance(settingsPreffix, str)
-            else settingsPreffix)
-        for setting, value in iteritems(self):
-            settingPath = setting.split('.')
-            if settingPath[0] in settingsPreffix:
-                name = settingPath[1]
-            else:
-                continue
-            settings[name] = value
-        return settings
+            (settingsPreffix, ) if isinstance(settingsPreffix, str)
+            else tuple(settingsPreffix))
+        if settingsPreffix not in self.__readerSettings:
+            settings = {}
+            for setting, value in self.items():
+                settingPath = setting.split('.')
+                if settingPath[0] in settingsPreffix:
+                    name = settingPath[1]
+                else:
+                    continue
+                settings[name] = value
+            self.__readerSettings[settingsPreffix] = settings
+        return dict(self.__readerSettings[settingsPreffix])
 
     def expandVariables(self):
         """Extend the keyword groups into lists of serpent variables.
@@ -392,7 +403,7 @@ class UserSettingsLoader(dict):
         messages.debug('Loading settings onto object with strict:{}'
                        .format(strict))
 
-        for key, value in iteritems(configSettings):
+        for key, value in configSettings.items():
             if isinstance(value, dict):
                 self.__recursiveLoad(value, strict, key)
             else:
@@ -400,7 +411,7 @@ class UserSettingsLoader(dict):
         messages.info('Done')
 
     def __recursiveLoad(self, curLevel, strict, preset):
-        for nextLevelKey, nextLevel in iteritems(curLevel):
+        for nextLevelKey, nextLevel in curLevel.items():
             newSettingName = preset + '.' + nextLevelKey
             if isinstance(nextLevel, dict):
                 self.__recursiveLoad(nextLevel, strict, newSettingName)
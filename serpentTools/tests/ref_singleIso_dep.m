@@ -0,0 +1,22 @@
+
+% Number of nuclides:
+
+ZAI = [
+541350
+];
+
+NAMES = [
+'Xe135           '
+];
+
+% fuel
+
+MAT_fuel_BURNUP = [ 0.00000E+00 1.90317E-02 ];
+
+MAT_fuel_ADENS = [
+1.00000E-02 2.00000E-02 % Xe135
+];
+
+BU = [ 0.00000E+00 1.93360E-02 ];
+
+DAYS = [ 0.00000E+00 5.00000E-01 ];
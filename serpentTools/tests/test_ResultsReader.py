@@ -5,8 +5,6 @@ import unittest
 
 import numpy
 
-import six
-
 from serpentTools.settings import rc
 from serpentTools.tests import TEST_ROOT
 from serpentTools.parsers import ResultsReader
@@ -146,7 +144,7 @@ class TesterCommonResultsReader(unittest.TestCase):
         expectedKeys = set(self.expectedMetadata)
         actualKeys = set(self.reader.metadata.keys())
         self.assertSetEqual(expectedKeys, actualKeys)
-        for key, expectedValue in six.iteritems(self.expectedMetadata):
+        for key, expectedValue in self.expectedMetadata.items():
             if isinstance(expectedValue, str):
                 self.assertSetEqual(set(self.reader.metadata[key]),
                                        set(expectedValue))
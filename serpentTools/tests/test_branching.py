@@ -3,8 +3,6 @@
 import os
 import unittest
 
-from six import iteritems
-
 from numpy.testing import assert_allclose
 
 from serpentTools.settings import rc
@@ -89,7 +87,7 @@ class BranchContainerTester(_BranchTesterHelper):
             'infS3': [9.84645E-3, -1.92215E-3, 1.36850E-4, 2.63834E-2],
             'cmmDiffcoefY': [1.56742E+00, 4.13948E-01]
         }
-        for name, valList in iteritems(assortedExpected):
+        for name, valList in assortedExpected.items():
             assert_allclose(self.refUniv.get(name), valList,
                             err_msg='Error in value: {}'.format(name))
 
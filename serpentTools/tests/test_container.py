@@ -3,7 +3,6 @@
 import unittest
 from itertools import product
 
-from six import iteritems
 from numpy import array, arange, ndarray
 from numpy.testing import assert_array_equal
 
@@ -22,8 +21,9 @@ class _HomogUnivTestHelper(unittest.TestCase):
     2D matrix.
     """
 
-    def setUp(self):
-        self.univ, vec, mat = self.getParams()
+    @classmethod
+    def setUpClass(cls):
+        cls.univ, vec, mat = cls.getParams()
         groupStructure = arange(NUM_GROUPS  + 1)
         testK = vec[0]
         # Data definition
@@ -33,18 +33,18 @@ class _HomogUnivTestHelper(unittest.TestCase):
                    'INF_KINF': vec}
         attrs = {'MACRO_E': groupStructure}
         # Partial dictionaries
-        self.b1Unc = self.b1Exp = {'b11': vec, 'b1AsList': vec, 'b1Kinf': testK}
-        self.infUnc = self.infExp = {
+        cls.b1Unc = cls.b1Exp = {'b11': vec, 'b1AsList': vec, 'b1Kinf': testK}
+        cls.infUnc = cls.infExp = {
                 'inf1': vec, 'infS0': mat, 'infKeff': testK, 'infKinf': testK,
                 }
-        self.gcUnc = self.gc = {'cmmTranspX': vec, 'impKeff': testK}
-        self.expAttrs = {'groups': groupStructure, 'numGroups': NUM_GROUPS} 
+        cls.gcUnc = cls.gc = {'cmmTranspX': vec, 'impKeff': testK}
+        cls.expAttrs = {'groups': groupStructure, 'numGroups': NUM_GROUPS} 
         # Use addData
-        for key, value in iteritems(attrs):
-            self.univ.addData(key, value)
-        for key, value in iteritems(rawData):
-            self.univ.addData(key, value, uncertainty=False)
-            self.univ.addData(key, value, uncertainty=True)
+        for key, value in attrs.items():
+            cls.univ.addData(key, value)
+        for key, value in rawData.items():
+            cls.univ.addData(key, value, uncertainty=False)
+            cls.univ.addData(key, value, uncertainty=True)
 
     def test_getB1Exp(self):
         """ Get Expected vales from B1 dictionary"""
@@ -82,7 +82,7 @@ class _HomogUnivTestHelper(unittest.TestCase):
 
     def test_attributes(self):
         """ Get metaData from corresponding dictionary"""
-        for key, value in iteritems(self.expAttrs):
+        for key, value in self.expAttrs.items():
             actual = getattr(self.univ, key)
             if isinstance(value, ndarray):
                 assert_array_equal(value, actual, err_msg=key)
@@ -107,23 +107,30 @@ class _HomogUnivTestHelper(unittest.TestCase):
 class VectoredHomogUnivTester(_HomogUnivTestHelper):
     """Class for testing HomogUniv that does not reshape scatter matrices"""
 
-    def getParams(self):
-        univ, vec, mat = getParams()
-        self.assertFalse(univ.reshaped)
-        return univ, vec, mat
+    @classmethod
+    def getParams(cls):
+        return getParams()
+
+    def test_reshaped(self):
+        """Verify the scatter matrices were not reshaped"""
+        self.assertFalse(self.univ.reshaped)
 
 
 class ReshapedHomogUnivTester(_HomogUnivTestHelper):
     """Class for testing HomogUniv that does reshape scatter matrices"""
 
-    def getParams(self):
+    @classmethod
+    def getParams(cls):
         from serpentTools.settings import rc
         with rc:
             rc.setValue('xs.reshapeScatter', True)
             univ, vec, mat = getParams()
-            self.assertTrue(univ.reshaped)
         return univ, vec, mat.reshape(NUM_GROUPS, NUM_GROUPS)
 
+    def test_reshaped(self):
+        """Verify the scatter matrices were reshaped"""
+        self.assertTrue(self.univ.reshaped)
+
 
 def getParams():
     """Return the universe, vector, and matrix for testing."""
@@ -134,7 +141,7 @@ def getParams():
 
 
 def compareDictOfArrays(expected, actualDict, dataType):
-    for key, value in iteritems(expected):
+    for key, value in expected.items():
         actual = actualDict[key]
         assert_array_equal(value, actual, 
                 err_msg="Error in {} dictionary: key={}"
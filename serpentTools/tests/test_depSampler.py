@@ -17,7 +17,6 @@ File Descriptions
 import unittest
 from os import path
 
-from six import iteritems
 from numpy import where, fabs, ndarray
 from numpy.testing import assert_allclose
 
@@ -68,7 +67,7 @@ class DepletedSamplerTester(unittest.TestCase):
         """
         errMsg = "{varN} {qty} for material {matN}"
         for name, material in self.sampler.iterMaterials():
-            for varName, varData in iteritems(material.data):
+            for varName, varData in material.data.items():
                 r0 = self.reader0.materials[name].data[varName]
                 r1 = self.reader1.materials[name].data[varName]
                 samplerUnc = material.uncertainties[varName]
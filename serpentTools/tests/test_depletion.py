@@ -4,12 +4,11 @@ import unittest
 
 import numpy
 
-import six
-
 from serpentTools.parsers import read
 from serpentTools.settings import rc
 from serpentTools.tests import TEST_ROOT
 from serpentTools.parsers.depletion import DepletionReader
+from serpentTools.objects.materials import DepletedMaterial
 
 
 class _DepletionTestHelper(unittest.TestCase):
@@ -62,7 +61,7 @@ class DepletionTester(_DepletionTestHelper):
         expectedKeys = set(expectedMetadata)
         actualKeys = set(self.reader.metadata.keys())
         self.assertSetEqual(expectedKeys, actualKeys)
-        for key, expectedValue in six.iteritems(expectedMetadata):
+        for key, expectedValue in expectedMetadata.items():
             numpy.testing.assert_equal(self.reader.metadata[key],
                                        expectedValue)
 
@@ -136,6 +135,14 @@ class DepletedMaterialTester(_DepletionTestHelper):
         numpy.testing.assert_equal(self.material.adens, expectedAdens)
         numpy.testing.assert_equal(self.material['ingTox'], expectedIngTox)
 
+    def test_isotopeDataBlock(self):
+        """Verify isotopic quantities share one contiguous array."""
+        self.assertIs(self.material.adens.base, self.material['ingTox'].base)
+        self.assertTrue(self.material.adens.flags['C_CONTIGUOUS'])
+        # only space for adens and ingTox is retained after reading
+        self.assertEqual(self.material.adens.base.shape,
+                         (2, ) + self.material.adens.shape)
+
     def test_getXY_burnup_full(self):
         """
         Verify the material can produce the full burnup vector through getXY.
@@ -171,6 +178,31 @@ class DepletedMaterialTester(_DepletionTestHelper):
         with self.assertRaises(KeyError):
             self.material.getValues('days', 'adens', timePoints=badDays)
 
+    def test_getXY_raisesError_badIsotope(self):
+        """Verify that a KeyError is raised for non-present isotopes."""
+        with self.assertRaises(KeyError):
+            self.material.getValues('days', 'adens', names=['U235', 'Pu241'])
+
+    def test_addData_raisesError_badValue(self):
+        """Verify that a ValueError is raised for values that are not floats"""
+        material = DepletedMaterial('bad', {})
+        with self.assertRaises(ValueError):
+            material.addData('BURNUP', '1 2 3 x')
+        with self.assertRaises(ValueError):
+            material.addData('ADENS', ['1 2', '3 4x'])
+        with self.assertRaises(ValueError):
+            material.addData('ADENS', ['1', '2 3 4'])
+        with self.assertRaises(ValueError):
+            material.addData('ADENS', '\n1 2\n3\n')
+
+    def test_addData_singleIsotope(self):
+        """Verify a string beginning on a new line is stored as 2D data"""
+        material = DepletedMaterial('single', {})
+        material.addData('ADENS', '\n1 2 3\n')
+        self.assertEqual(material.adens.shape, (1, 3))
+        material.addData('BURNUP', ' 1 2 3 ')
+        self.assertEqual(material.burnup.shape, (3, ))
+
     def test_fetchData(self):
         """Verify that key errors are raised when bad data are requested."""
         with self.assertRaises(KeyError):
@@ -182,5 +214,93 @@ class DepletedMaterialTester(_DepletionTestHelper):
                            names=['Xe135', 'U235'])
 
 
+class DepletedMaterialTimePointsTester(unittest.TestCase):
+    """Class that tests selecting points from unsorted or repeated x values"""
+
+    def setUp(self):
+        self.material = DepletedMaterial(
+            'fuel', {'names': ['A', 'B'], 'days': numpy.arange(4.0)})
+        self.material.addData('BURNUP', '0 1 1 2')
+        self.material.addData('VOLUME', '3 1 2 4')
+        self.material.addData('ADENS', ['1 2 3 4', '5 6 7 8'])
+
+    def test_repeatedBurnup(self):
+        """Verify all points are returned for repeated burnup values."""
+        actual = self.material.getValues('burnup', 'adens',
+                                         self.material.burnup, ['A'])
+        numpy.testing.assert_equal(actual, [[1, 2, 3, 4]])
+        actual = self.material.getValues('burnup', 'adens', [1], ['B'])
+        numpy.testing.assert_equal(actual, [[6, 7]])
+
+    def test_unsortedX(self):
+        """Verify points are found when x values are not sorted."""
+        actual = self.material.getValues('volume', 'adens', [4, 1], ['B'])
+        numpy.testing.assert_equal(actual, [[6, 8]])
+        with self.assertRaises(KeyError):
+            self.material.getValues('volume', 'adens', [5], ['B'])
+
+    def test_emptyX_raisesError(self):
+        """Verify a KeyError is raised when no x values are stored."""
+        self.material.addData('VOLUME', '')
+        with self.assertRaises(KeyError):
+            self.material.getValues('volume', 'adens', [1], ['B'])
+
+
+    def test_integerX_raisesError_fractionalPoint(self):
+        """Verify fractional points are not truncated to match integer x."""
+        material = DepletedMaterial(
+            'int', {'names': ['A', 'B'], 'days': numpy.array([0, 1, 2])})
+        material.addData('ADENS', ['1 2 3', '4 5 6'])
+        numpy.testing.assert_equal(
+            material.getValues('days', 'adens', [1], ['A']), [[2]])
+        with self.assertRaises(KeyError):
+            material.getValues('days', 'adens', [1.5], ['A'])
+
+
+class DepletedMaterialFloat32Tester(unittest.TestCase):
+    """Class that tests storing material data with single precision."""
+
+    @classmethod
+    def setUpClass(cls):
+        filePath = os.path.join(TEST_ROOT, 'ref_dep.m')
+        with rc as tempRC:
+            tempRC['depletion.dtype'] = 'float32'
+            reader = DepletionReader(filePath)
+        reader.read()
+        cls.material = reader.materials['fuel']
+
+    def test_dtype(self):
+        """Verify all material data are stored as float32."""
+        for key, value in self.material.data.items():
+            self.assertEqual(value.dtype, numpy.float32, msg=key)
+
+    def test_getXY_burnup_slice(self):
+        """Verify time points are located with single precision data."""
+        actual = self.material.getValues('burnup', 'adens',
+                                         timePoints=[1.90317E-2, 1.66071E0],
+                                         names=['U235'])
+        numpy.testing.assert_allclose(actual, [[5.57764E-04, 5.14643E-04]],
+                                      rtol=1E-6)
+
+
+class SingleIsotopeDepletionTester(unittest.TestCase):
+    """Class that tests reading a file with a single isotope."""
+
+    @classmethod
+    def setUpClass(cls):
+        filePath = os.path.join(TEST_ROOT, 'ref_singleIso_dep.m')
+        reader = DepletionReader(filePath)
+        reader.read()
+        cls.material = reader.materials['fuel']
+
+    def test_isotopeShape(self):
+        """Verify isotopic data keep one row for the single isotope."""
+        self.assertEqual(self.material.adens.shape, (1, 2))
+        self.assertEqual(self.material.burnup.shape, (2,))
+        numpy.testing.assert_equal(
+            self.material.getValues('days', 'adens', names=['Xe135']),
+            [[1E-2, 2E-2]])
+
+
 if __name__ == '__main__':
     unittest.main()
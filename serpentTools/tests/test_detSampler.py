@@ -25,8 +25,6 @@ from math import sqrt
 from os import path
 import unittest
 
-from six import iteritems
-
 from numpy import square, sqrt
 from numpy.testing import assert_allclose
 
@@ -42,7 +40,7 @@ _DET_FILES = {
     'smallxy': 'bwr_smallxy'
 }
 DET_FILES = {key: path.join(TEST_ROOT, val + '_det0.m')
-             for key, val in iteritems(_DET_FILES)}
+             for key, val in _DET_FILES.items()}
 
 SQRT2 = sqrt(2)
 
@@ -4,7 +4,6 @@ File for testing the history reader
 from os.path import join
 
 import unittest
-from six import iteritems
 from numpy import array
 from numpy.testing import assert_array_equal
 
@@ -232,10 +231,10 @@ _EXPECTED_ARRAY_TAILS = {
 }
 
 EXPECTED_ARRAY_HEADS = {key: array(value) 
-                        for key, value in iteritems(_EXPECTED_ARRAY_HEADS)}
+                        for key, value in _EXPECTED_ARRAY_HEADS.items()}
 
 EXPECTED_ARRAY_TAILS = {key: array(value)
-                        for key, value in iteritems(_EXPECTED_ARRAY_TAILS)}
+                        for key, value in _EXPECTED_ARRAY_TAILS.items()}
 
 del _EXPECTED_ARRAY_HEADS, _EXPECTED_ARRAY_TAILS
 
@@ -271,24 +270,24 @@ class HistoryTester(unittest.TestCase):
 
     def test_sizes(self):
         """Verify the arrays are of the correct size."""
-        for key, shape in iteritems(EXPECTED_ARRAYS_SHAPE):
+        for key, shape in EXPECTED_ARRAYS_SHAPE.items():
             self.assertTupleEqual(shape, self.arrays[key].shape,
                                   msg=key)
     def test_getItem(self):
         """Verify the getitem indexing is functional."""
-        for key, readerArray in iteritems(self.arrays):
+        for key, readerArray in self.arrays.items():
             self.assertIs(readerArray, self.reader[key], msg=key)
 
     def test_arrayHeads(self):
         """Verify the first few lines of each array are correct."""
-        for key, expectedArray in iteritems(EXPECTED_ARRAY_HEADS):
+        for key, expectedArray in EXPECTED_ARRAY_HEADS.items():
             numRows = expectedArray.shape[0]
             actual = self.arrays[key][:numRows]
             assert_array_equal(expectedArray, actual, err_msg=key)
     
     def test_arrayTails(self):
         """Verify the last few lines of each array are correct."""
-        for key, expectedArray in iteritems(EXPECTED_ARRAY_TAILS):
+        for key, expectedArray in EXPECTED_ARRAY_TAILS.items():
             numRows = expectedArray.shape[0]
             actual = self.arrays[key][-numRows:]
             assert_array_equal(expectedArray, actual, err_msg=key)
@@ -2,8 +2,6 @@
 from os import path
 import unittest
 
-import six
-
 from numpy import array
 from numpy.testing import assert_array_equal
 
@@ -108,7 +106,7 @@ class TestReaderInfer(unittest.TestCase):
             'test_res.m': ResultsReader, 'test_fmtx99.m': FissionMatrixReader,
             'test_res': None, 'test.coe_dep.m': DepletionReader
         }
-        for fileP, expectedReader in six.iteritems(expectedClasses):
+        for fileP, expectedReader in expectedClasses.items():
             if expectedReader is None:
                 with self.assertRaises(SerpentToolsException):
                     inferReader(fileP)
@@ -2,7 +2,6 @@ from os.path import join
 import unittest
 from collections import OrderedDict
 
-from six import iteritems
 from numpy import array, inf
 from numpy.testing import assert_allclose
 
@@ -150,7 +149,7 @@ class SensitivityTester(unittest.TestCase):
 
     def test_parameters(self):
         expected = {'nMat': 1, 'nEne': 2, 'nZai': 2, 'nPert': 7, 'latGen': 14}
-        for key, value in iteritems(expected):
+        for key, value in expected.items():
             actual = getattr(self.reader, key)
             self.assertEqual(value, actual, 
                              msg="Parameter: {}".format(key))
@@ -5,7 +5,6 @@ import warnings
 import unittest
 
 import yaml
-import six
 
 from serpentTools import settings
 from serpentTools.messages import deprecated, willChange
@@ -67,10 +66,23 @@ class RCTester(unittest.TestCase):
             'materialVariables': [],
             'materials': [],
             'processTotal': True,
+            'dtype': 'float64',
         }
         actual = self.rc.getReaderSettings(readerName)
         self.assertDictEqual(expected, actual)
 
+    def test_cachedReaderSettings(self):
+        """Verify cached reader settings are copies that reflect updates."""
+        first = self.rc.getReaderSettings('depletion')
+        first.pop('materials')
+        self.assertIn('materials', self.rc.getReaderSettings('depletion'))
+        with self.rc as tempRC:
+            tempRC['depletion.processTotal'] = False
+            self.assertFalse(
+                tempRC.getReaderSettings('depletion')['processTotal'])
+        self.assertTrue(
+            self.rc.getReaderSettings('depletion')['processTotal'])
+
     def test_readerWithUpdatedSettings(self):
         """Verify the settings passed to the reader reflect the update."""
         from serpentTools.parsers.depletion import DepletionReader
@@ -143,7 +155,7 @@ class ConfigLoaderTester(unittest.TestCase):
             yaml.dump(settings, out)
         with self.rc:
             self.rc.loadYaml(filePath, strict)
-            for key, value in six.iteritems(expected):
+            for key, value in expected.items():
                 if isinstance(value, list):
                     self.assertListEqual(value, self.rc[key])
                 else:
@@ -1,5 +1,4 @@
 from os.path import join, dirname
-from os import getenv
 try:
     from setuptools import setup
     HAS_SETUPTOOLS = True
@@ -11,6 +10,8 @@ except ImportError:
 
 import versioneer
 
+version = versioneer.get_version()
+
 with open('README.rst') as readme:
     longDesc = readme.read()
 
@@ -27,16 +28,15 @@ classifiers = [
 ]
 
 installRequires = [
-    'six',
     'numpy>=1.11.1',
     'matplotlib>=1.5.0',
     'pyyaml>=3.08',
 ]
 
-if not getenv('ONTRAVIS', False):
-    # hack to install scipy if not on cluster
-    # PR 45/44
-    installRequires.append('scipy')
+extrasRequire = {
+    # sparse decay matrices from depmtx files
+    'sparse': ['scipy'],
+}
 
 installVarYamlFrom = join('serpentTools', 'variables.yaml')
 
@@ -56,7 +56,7 @@ setupArgs = {
     'classifiers': classifiers,
     'keywords': 'SERPENT file parsers transport',
     'license': 'MIT',
-    'version': versioneer.get_version(),
+    'version': version,
     'cmdclass': versioneer.get_cmdclass(),
     'data_files': [(dirname(installVarYamlFrom), [installVarYamlFrom])]
 }
@@ -64,6 +64,7 @@ if HAS_SETUPTOOLS:
     setupArgs.update({
         'python_requires': pythonRequires,
         'install_requires': installRequires,
+        'extras_require': extrasRequire,
         'test_suite': 'serpentTools.tests'
     })
 
@@ -73,5 +74,5 @@ if not HAS_SETUPTOOLS:
     warnings.warn(
             'The following packages are required to use serpentTools version '
             '{}:\n{}\nPlease ensure they are installed prior to use'
-            .format(versioneer.get_version(), '\n'.join(installRequires)))
+            .format(version, '\n'.join(installRequires)))
 